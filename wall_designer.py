@@ -1,256 +1,658 @@
+import hashlib
 import math
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import astuple, dataclass, field
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Mapping
 import numpy as np
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import os
 
+# numba is opt-in: importing and loading it costs far more than it saves on
+# the memoized numeric core, so by default the core runs as plain Python
+if os.environ.get("WALL_DESIGNER_NUMBA") == "1":
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 HEIGHT = 2  # meters
 WIDTH = 3   # meters
 DEPTH = 3   # meters
 
-@dataclass
+# Plywood sheet size
+SHEET_H_MM, SHEET_W_MM = 2500, 1250  # millimeters
+
+# Combined safety factor: 3.0 general safety x 2.5 for dynamic loads
+SAFETY_FACTOR = 7.5
+
+# Output directories (designs/, materials_lists/) live next to this file
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Directories _ensure_dir has already created or found
+_CREATED_DIRS = set()
+
+# Above this many T-nuts the grid is drawn as one raster image instead of markers
+TNUT_RASTER_THRESHOLD = 1000
+
+# Part of every rendered design's cache key; bump it when draw_wall's output
+# changes so PNGs saved by an older version are re-rendered
+_DESIGN_CACHE_VERSION = 4
+
+# Views draw_wall renders by default, see draw_3d, draw_top and draw_side
+DESIGN_VIEWS = ('3d', 'top', 'side')
+
+# Resolution of the saved design PNG
+DESIGN_DPI = 150
+
+# Figure reused by draw_wall for saved-only renders, see _design_figure
+_FIGURE = None
+
+# Encodes and writes saved-only renders off the main thread. One worker keeps
+# saves to the same path in order; pending saves finish before exit.
+_PNG_SAVER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wall-design-png")
+
+# Latest background save per PNG path as (key, Future). Until it finishes,
+# the .hash file on disk may still describe an older design.
+_PENDING_SAVES = {}
+
+# Safety and geometry checks as (is_invalid, message) pairs, checked in order.
+# Predicates only use arithmetic and comparisons, so they work on a single
+# WallSpec as well as on arrays of wall dimensions in calculate_wall_batch.
+VALIDATION_RULES = (
+    # Angle safety constraints
+    (lambda s: s.angle_deg < 15,
+     lambda s: f"Wall angle {s.angle_deg:.1f}° is too shallow. Minimum angle is 15°"),
+    (lambda s: s.angle_deg > 70,  # Maximum safe angle for home climbing walls
+     lambda s: f"Wall angle {s.angle_deg:.1f}° is too steep. Maximum safe angle is 70°"),
+    # Height for home installation safety
+    (lambda s: s.height > 4.0,  # 4 meters is maximum safe height for home installation
+     lambda s: f"Height {s.height:.1f}m exceeds safe limit of 4.0m for home installation"),
+    # Width and height-to-width ratio (maximum 2:1) for stability
+    (lambda s: s.width < 1.2,
+     lambda s: f"Width {s.width:.1f}m is too small for stability. Minimum width is 1.2m"),
+    (lambda s: s.height / s.width > 2.0,
+     lambda s: f"Height-to-width ratio {s.height/s.width:.1f} exceeds safe limit of 2.0"),
+    # Required depth based on angle, with a small tolerance (1cm) for rounding errors
+    (lambda s: s.height * s.tan_a > s.depth + 0.01,
+     lambda s: f"Not enough depth. Maximum angle for given depth is {math.degrees(math.atan(s.depth / s.height)):.1f}°"),
+    (lambda s: s.height * s.tan_a > s.depth,
+     lambda s: "Not enough depth for this angle. Reduce angle or increase depth."),
+)
+
+# Timber cut list entries: piece name and length in meters
+TIMBER_DTYPE = np.dtype([('name', 'U20'), ('length', 'f8')])
+
+def _wall_angle_deg(height: float, depth: float) -> float:
+    """Wall angle in degrees for the given height and depth, rounded to 0.1°
+
+    Shared by WallSpec and calculate_wall_batch so both round the same way;
+    np.round disagrees with round() at .x5 boundaries.
+    """
+    return round(math.degrees(math.atan(depth / height)), 1)
+
+def _trig(angle_deg: float) -> tuple:
+    """Return (radians, cos, sin, tan) for an angle in degrees"""
+    angle_rad = math.radians(angle_deg)
+    return angle_rad, math.cos(angle_rad), math.sin(angle_rad), math.tan(angle_rad)
+
+# Trig for 0.0° to 90.0° in 0.1° steps, the resolution WallSpec rounds angles to.
+# One dict lookup is about twice as fast as the four math calls it replaces.
+_TRIG_BY_DEG = {i / 10: _trig(i / 10) for i in range(901)}
+
+# The same table as an array indexed by tenths of a degree, for calculate_wall_batch
+_TRIG_TABLE = np.array([_TRIG_BY_DEG[i / 10] for i in range(901)])
+
+@dataclass(frozen=True, slots=True)
 class WallSpec:
     height: float  # meters
     width: float   # meters
     depth: float   # meters
-    
-    @property
-    def angle_deg(self) -> float:
-        """Calculate the wall angle in degrees based on height and depth"""
-        return round(math.degrees(math.atan(self.depth / self.height)), 1)
-
-@dataclass
+    tnut_spacing: float = 0.20  # meters
+
+    # Derived geometry, computed once in __post_init__
+    angle_deg: float = field(init=False, compare=False)
+    angle_rad: float = field(init=False, repr=False, compare=False)
+    cos_a: float = field(init=False, repr=False, compare=False)
+    sin_a: float = field(init=False, repr=False, compare=False)
+    tan_a: float = field(init=False, repr=False, compare=False)
+    panel_height_m: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Calculate the wall angle in degrees based on height and depth, and cache its trig"""
+        if self.height <= 0 or self.width <= 0 or self.depth <= 0:
+            raise ValueError("All dimensions must be positive numbers")
+        if self.tnut_spacing <= 0:
+            raise ValueError("T-nut spacing must be a positive number")
+
+        angle_deg = _wall_angle_deg(self.height, self.depth)
+        trig = _TRIG_BY_DEG.get(angle_deg)
+        angle_rad, cos_a, sin_a, tan_a = trig if trig is not None else _trig(angle_deg)
+
+        # Frozen dataclass, so derived fields have to bypass __setattr__
+        object.__setattr__(self, "angle_deg", angle_deg)
+        object.__setattr__(self, "angle_rad", angle_rad)
+        object.__setattr__(self, "cos_a", cos_a)
+        object.__setattr__(self, "sin_a", sin_a)
+        object.__setattr__(self, "tan_a", tan_a)
+        object.__setattr__(self, "panel_height_m", self.height / cos_a)
+
+@dataclass(frozen=True, slots=True)
 class MaterialList:
     plywood_sheets: int
-    timber_lengths: list
-    cut_angles: dict
+    timber_lengths: np.ndarray = field(compare=False)  # read-only TIMBER_DTYPE array, compared via timber_key
+    cut_angles: Mapping[str, float] = field(hash=False)  # read-only, derived from the spec
     safe_climber_weight: float
+    panel_height: float  # sloped panel length in meters
+    panel_area: float    # climbing surface in m²
+    sheet_w_mm: int      # plywood sheet size the count was packed for
+    sheet_h_mm: int
+    safety_factor: float  # divisor applied to the raw capacity
+
+    # Hashable copy of the cut list, so equality and hashing (and the caches
+    # keyed on MaterialList) see the timber even though the array can't compare
+    timber_key: tuple = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Derive timber_key from timber_lengths"""
+        timber = self.timber_lengths
+        object.__setattr__(self, "timber_key",
+                           tuple(zip(timber['name'].tolist(), timber['length'].tolist())))
+
+@lru_cache(maxsize=1024)
+def pack_plywood_sheets(width_mm: int, length_mm: int,
+                        sheet_w_mm: int = SHEET_W_MM, sheet_h_mm: int = SHEET_H_MM) -> int:
+    """Count the sheets needed to cut a width x length panel, reusing offcuts
+
+    The panel is split on a sheet-sized grid into full sheets, edge strips and
+    a corner piece. The pieces are packed onto sheets with a
+    First-Fit-Decreasing-Height shelf packer. Each piece prefers its long
+    side across the sheet, so short strips can share a sheet, but is turned
+    90° when only that orientation fits an existing shelf or sheet.
+    """
+    cols, strip_w = divmod(width_mm, sheet_w_mm)
+    rows, strip_h = divmod(length_mm, sheet_h_mm)
+
+    pieces = [(sheet_w_mm, strip_h)] * cols if strip_h else []
+    if strip_w:
+        pieces += [(strip_w, sheet_h_mm)] * rows
+        if strip_h:
+            pieces.append((strip_w, strip_h))
+
+    # Orientations (width, height) each piece fits the sheet in, preferred
+    # first, then place the tallest preferred orientation first
+    variants = []
+    for a, b in pieces:
+        long_side, short_side = max(a, b), min(a, b)
+        turns = [(long_side, short_side), (short_side, long_side)]
+        if long_side > sheet_w_mm:
+            turns.reverse()
+        variants.append([(w, h) for w, h in dict.fromkeys(turns)
+                         if w <= sheet_w_mm and h <= sheet_h_mm])
+    variants.sort(key=lambda turns: turns[0][1], reverse=True)
+
+    sheets = []  # per sheet: [height used by shelves, [[shelf height, width used], ...]]
+    for turns in variants:
+        for sheet in sheets:
+            shelf = next(((sh, w) for w, h in turns for sh in sheet[1]
+                          if h <= sh[0] and sh[1] + w <= sheet_w_mm), None)
+            if shelf is not None:
+                shelf[0][1] += shelf[1]
+                break
+            turn = next(((w, h) for w, h in turns if sheet[0] + h <= sheet_h_mm), None)
+            if turn is not None:
+                sheet[0] += turn[1]
+                sheet[1].append([turn[1], turn[0]])
+                break
+        else:
+            w, h = turns[0]
+            sheets.append([h, [[h, w]]])
+
+    # Full sheets are used whole, so they never share with offcuts
+    return cols * rows + len(sheets)
+
+@njit(cache=True)
+def _wall_core(h, w, tan_a, angle_deg, safety_divisor):
+    """Scalar arithmetic behind calculate_wall, compiled with numba when opted in
+
+    The panel length is not derived here; it is WallSpec.panel_height_m.
 
-def calculate_wall(spec: WallSpec) -> MaterialList:
-    # Validate dimensions
-    if spec.height <= 0 or spec.width <= 0 or spec.depth <= 0:
-        raise ValueError("All dimensions must be positive numbers")
-
-    # Validate angle safety constraints
-    angle_deg = spec.angle_deg
-    if angle_deg < 15:
-        raise ValueError(f"Wall angle {angle_deg:.1f}° is too shallow. Minimum angle is 15°")
-    if angle_deg > 70:  # Maximum safe angle for home climbing walls
-        raise ValueError(f"Wall angle {angle_deg:.1f}° is too steep. Maximum safe angle is 70°")
-        
-    # Validate height for home installation safety
-    if spec.height > 4.0:  # 4 meters is maximum safe height for home installation
-        raise ValueError(f"Height {spec.height:.1f}m exceeds safe limit of 4.0m for home installation")
-        
-    # Validate width and height-to-width ratio for stability
-    if spec.width < 1.2:  # Minimum width for stability
-        raise ValueError(f"Width {spec.width:.1f}m is too small for stability. Minimum width is 1.2m")
-    
-    # Check height-to-width ratio (maximum 2:1 for stability)
-    if spec.height / spec.width > 2.0:
-        raise ValueError(f"Height-to-width ratio {spec.height/spec.width:.1f} exceeds safe limit of 2.0")
-
-    h = spec.height * 1000
-    w = spec.width * 1000
-    d = spec.depth * 1000
-    angle = math.radians(angle_deg)
-
-    # Calculate required depth based on angle
-    panel_depth = spec.height * math.tan(angle)
-    
-    # Add a small tolerance (1cm) to account for rounding errors
-    if panel_depth > spec.depth + 0.01:
-        required_depth = panel_depth
-        actual_angle = math.degrees(math.atan(spec.depth / spec.height))
-        raise ValueError(f"Not enough depth. Maximum angle for given depth is {actual_angle:.1f}°")
-
-    panel_height = h / math.cos(angle)
-    panel_depth = h * math.tan(angle)
-    if panel_depth > d:
-        raise ValueError("Not enough depth for this angle. Reduce angle or increase depth.")
-
-    # Plywood sheet 2500x1250 mm
-    sheet_h, sheet_w = 2500, 1250
-    sheets_per_row = math.ceil(w / sheet_w)
-    rows = math.ceil(panel_height / sheet_h)
-    total_sheets = sheets_per_row * rows
-
-    # Hardware calculations removed - holds can be placed as needed
-
-    # Frame timber lengths
-    base_beam = w
-    uprights = 2 * h / math.cos(angle)
-    cross_braces = w
-    kicker_depth = panel_depth
-    timber_lengths = [
-        ("Base beam", base_beam / 1000),
-        ("Uprights (x2)", uprights / 1000),
-        ("Cross braces (x2)", cross_braces / 1000),
-        ("Kicker/struts", kicker_depth / 1000)
-    ]
-
-    cut_angles = {
-        "Upright to base": spec.angle_deg,
-        "Top plate join": 90 - spec.angle_deg
-    }
+    Returns:
+        tuple: (panel_depth, safe_climber_weight) in meters and kg
+    """
+    panel_depth = h * tan_a
 
     # Safety calculations with strict validation
-    panel_capacity = (w / 1000) * (h / 1000) * 200  # kg/m² for 18mm structural plywood
-    timber_capacity = 1200  # kg for structural grade timber
-    bolt_capacity = 6400   # kg for M10 bolts
-    
+    panel_capacity = w * h * 200.0  # kg/m² for 18mm structural plywood
+    timber_capacity = 1200.0  # kg for structural grade timber
+    bolt_capacity = 6400.0   # kg for M10 bolts
+
     # Additional angle-based safety factors
-    if angle > math.radians(45):
+    if angle_deg > 45:
         # Reduce capacities for steep angles due to increased shear forces
         panel_capacity *= 0.8
         timber_capacity *= 0.8
-        
+
     raw_capacity = min(panel_capacity, timber_capacity, bolt_capacity)
-    
-    # Strict safety factors:
+
+    # Strict safety factors (default divisor of 7.5):
     # - Factor of 3.0 for general safety
     # - Additional factor of 2.5 for dynamic loads
-    # - Total safety factor of 7.5
-    safe_capacity = raw_capacity / 3.0
-    safe_climber_weight = safe_capacity / 2.5
-    
-    # Validate minimum safe capacity
-    if safe_climber_weight < 80:  # Minimum safe capacity for adult climbers
-        raise ValueError(f"Design cannot safely support minimum required weight of 80kg")
-
-    return MaterialList(
-        plywood_sheets=total_sheets,
-        timber_lengths=timber_lengths,
-        cut_angles=cut_angles,
-        safe_climber_weight=safe_climber_weight
-    )
+    return panel_depth, raw_capacity / safety_divisor
 
-def create_3d_wall(spec: WallSpec):
-    """Generate 3D coordinates for the wall structure"""
-    angle = math.radians(spec.angle_deg)
-    h, w = spec.height, spec.width
-    d = h * math.tan(angle)
-
-    # Main wall panel vertices
-    panel = np.array([
-        [0, 0, 0],           # bottom left
-        [w, 0, 0],           # bottom right
-        [w, h*math.cos(angle), h*math.sin(angle)],  # top right
-        [0, h*math.cos(angle), h*math.sin(angle)]   # top left
-    ])
+def calculate_wall(spec: WallSpec) -> MaterialList:
+    """Calculate materials for a wall, reusing results for identical specs"""
+    return _calculate_wall_cached(spec)
 
-    # Support structure vertices
-    left_support = np.array([
-        [0, 0, 0],           # bottom front
-        [0, 0, d],           # bottom back
-        [0, h*math.cos(angle), h*math.sin(angle)],  # top front
-    ])
+def make_wall_calculator(sheet_h_mm: int = SHEET_H_MM, sheet_w_mm: int = SHEET_W_MM,
+                         safety_divisor: float = SAFETY_FACTOR):
+    """Build a cached wall calculator with the sheet size and safety factor fixed
 
-    right_support = np.array([
-        [w, 0, 0],           # bottom front
-        [w, 0, d],           # bottom back
-        [w, h*math.cos(angle), h*math.sin(angle)]   # top front
-    ])
+    The returned function takes a WallSpec and returns a MaterialList, like
+    calculate_wall, with the given constants bound as closure locals.
+    """
+    @lru_cache(maxsize=256)
+    def calculate(spec: WallSpec) -> MaterialList:
+        # Positive dimensions and T-nut spacing are validated when the WallSpec is created
+        for is_invalid, message in VALIDATION_RULES:
+            if is_invalid(spec):
+                raise ValueError(message(spec))
+
+        # Everything below stays in meters
+        w = spec.width
+        panel_height = spec.panel_height_m
+        panel_depth, safe_climber_weight = _wall_core(
+            spec.height, w, spec.tan_a, spec.angle_deg, safety_divisor)
+
+        # Plywood sheets, packed on whole millimetres
+        total_sheets = pack_plywood_sheets(round(w * 1000), round(panel_height * 1000),
+                                           sheet_w_mm, sheet_h_mm)
+
+        # Hardware calculations removed - holds can be placed as needed
+
+        # Frame timber lengths
+        timber_lengths = np.array([
+            ("Base beam", w),
+            ("Uprights (x2)", 2 * panel_height),
+            ("Cross braces (x2)", w),
+            ("Kicker/struts", panel_depth)
+        ], dtype=TIMBER_DTYPE)
+        timber_lengths.flags.writeable = False  # shared by every cached lookup
+
+        cut_angles = MappingProxyType({
+            "Upright to base": spec.angle_deg,
+            "Top plate join": 90 - spec.angle_deg
+        })
+
+        # Validate minimum safe capacity
+        if safe_climber_weight < 80:  # Minimum safe capacity for adult climbers
+            raise ValueError(f"Design cannot safely support minimum required weight of 80kg")
+
+        return MaterialList(
+            plywood_sheets=total_sheets,
+            timber_lengths=timber_lengths,
+            cut_angles=cut_angles,
+            safe_climber_weight=safe_climber_weight,
+            panel_height=panel_height,
+            panel_area=w * panel_height,
+            sheet_w_mm=sheet_w_mm,
+            sheet_h_mm=sheet_h_mm,
+            safety_factor=safety_divisor
+        )
+
+    return calculate
+
+_calculate_wall_cached = make_wall_calculator()
+
+def calculate_wall_batch(heights, widths, depths) -> dict:
+    """Calculate plywood and safety figures for many walls in one vectorized pass
+
+    Mirrors calculate_wall for parameter sweeps, down to how angles are
+    rounded. Instead of raising, walls failing any VALIDATION_RULES check or
+    the 80kg minimum are flagged in the "valid" array.
+
+    Returns:
+        dict: Arrays of angle_deg, plywood_sheets, safe_climber_weight and valid
+    """
+    heights, widths, depths = np.broadcast_arrays(
+        np.asarray(heights, dtype=np.float64),
+        np.asarray(widths, dtype=np.float64),
+        np.asarray(depths, dtype=np.float64)
+    )
 
-    # Base frame vertices
-    base = np.array([
-        [0, 0, 0],           # front left
-        [w, 0, 0],           # front right
-        [w, 0, d],           # back right
-        [0, 0, d]            # back left
+    # Angles and trig come from the same helper and table as WallSpec, so
+    # boundary walls validate identically; non-positive dimensions are
+    # flagged invalid below
+    positive = (heights > 0) & (depths > 0)
+    angle_of = np.frompyfunc(_wall_angle_deg, 2, 1)
+    angles_deg = np.where(positive,
+                          np.asarray(angle_of(np.where(positive, heights, 1.0),
+                                              np.where(positive, depths, 1.0)), dtype=np.float64),
+                          np.nan)
+    trig = _TRIG_TABLE[np.rint(np.where(positive, angles_deg, 0) * 10).astype(np.intp)]
+    cos_a, tan_a = trig[..., 1], trig[..., 3]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        panel_heights = heights / cos_a
+    widths_mm = np.rint(widths * 1000)
+    panel_heights_mm = np.rint(panel_heights * 1000)
+
+    # Same capacities and combined safety factor as calculate_wall
+    factor = np.where(angles_deg > 45, 0.8, 1.0)
+    raw_capacity = np.minimum.reduce([
+        widths * heights * 200 * factor,
+        1200 * factor,
+        np.full_like(heights, 6400)
     ])
+    safe_climber_weight = raw_capacity / SAFETY_FACTOR
+
+    # Evaluate every rule on the whole batch at once
+    walls = SimpleNamespace(height=heights, width=widths, depth=depths,
+                            angle_deg=angles_deg, tan_a=tan_a)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        invalid = np.logical_or.reduce([is_invalid(walls) for is_invalid, _ in VALIDATION_RULES])
+    invalid |= (heights <= 0) | (widths <= 0) | (depths <= 0) | (safe_climber_weight < 80)
+
+    # Sheet packing is combinatorial, so it runs per wall (cached on whole
+    # millimetres); invalid walls are skipped as their panels may be unbounded
+    sheets = np.zeros(heights.shape, dtype=np.int64)
+    for i in np.ndindex(heights.shape):
+        if not invalid[i]:
+            sheets[i] = pack_plywood_sheets(int(widths_mm[i]), int(panel_heights_mm[i]))
+
+    return {
+        "angle_deg": angles_deg,
+        "plywood_sheets": sheets,
+        "safe_climber_weight": safe_climber_weight,
+        "valid": ~invalid
+    }
 
-    return panel, left_support, right_support, base
+@lru_cache(maxsize=128)
+def create_3d_wall(spec: WallSpec):
+    """Generate 3D coordinates for the wall structure
+
+    Results are cached per spec, so the returned arrays are read-only.
+    """
+    h, w = spec.height, spec.width
+    hc, hs = h * spec.cos_a, h * spec.sin_a  # top edge, shared by panel and supports
+    d = h * spec.tan_a
+
+    # All vertices share one buffer, filled a coordinate column at a time;
+    # each part below is a view into it
+    #   0-3   panel:   bottom left, bottom right, top right, top left
+    #   4-6   left support:  bottom front, bottom back, top front
+    #   7-9   right support: bottom front, bottom back, top front
+    #   10-13 base:    front left, front right, back right, back left
+    verts = np.empty((4 + 3 + 3 + 4, 3), dtype=np.float64)
+    verts[:, 0] = (0, w, w, 0,    0, 0, 0,    w, w, w,    0, w, w, 0)
+    verts[:, 1] = (0, 0, hc, hc,  0, 0, hc,   0, 0, hc,   0, 0, 0, 0)
+    verts[:, 2] = (0, 0, hs, hs,  0, d, hs,   0, d, hs,   0, 0, d, d)
+    verts.flags.writeable = False  # shared by every cached lookup
+
+    return verts[0:4], verts[4:7], verts[7:10], verts[10:14]
+
+def _ensure_dir(path: str):
+    """Create path if needed, touching the filesystem once per directory"""
+    if path not in _CREATED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+def _design_key(spec: WallSpec, views=DESIGN_VIEWS) -> str:
+    """Cache key for a rendered design, stored next to the PNG as <png>.hash"""
+    payload = repr((_DESIGN_CACHE_VERSION, astuple(spec), tuple(views))).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+def _design_figure(show: bool):
+    """Figure for draw_wall to render into
+
+    The plot window needs a pyplot figure. Saved-only renders reuse one
+    Figure kept outside pyplot, so parameter sweeps neither leak figures
+    nor pay figure setup on every call.
+    """
+    global _FIGURE
+    if show:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=(15, 10))
+    if _FIGURE is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        _FIGURE = Figure(figsize=(15, 10), dpi=DESIGN_DPI)
+        FigureCanvasAgg(_FIGURE)  # rendered to a pixel buffer, see draw_wall
+    else:
+        _FIGURE.clear()
+    return _FIGURE
+
+def _add_view_axes(fig, views):
+    """Add one subplot per view: 3D on the left, 2D views stacked on the right"""
+    flat = [view for view in views if view != '3d']
+    axes, row = [], 0
+    for view in views:
+        if view == '3d':
+            axes.append(fig.add_subplot(1, 2 if flat else 1, 1, projection='3d'))
+        else:
+            row += 1
+            if '3d' in views:
+                axes.append(fig.add_subplot(len(flat), 2, 2 * row))
+            else:
+                axes.append(fig.add_subplot(len(flat), 1, row))
+    return axes
+
+def draw_3d(spec: WallSpec, ax):
+    """Draw the panel, supports and base on a 3D axes"""
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
-def draw_wall(spec: WallSpec, materials: MaterialList):
-    fig = plt.figure(figsize=(15, 10))
-    
-    # Main 3D view (top left)
-    ax1 = fig.add_subplot(121, projection='3d')
     panel, left_support, right_support, base = create_3d_wall(spec)
     
-    # Plot main climbing surface
-    ax1.add_collection3d(Poly3DCollection([panel], facecolors='lightgray', alpha=0.3, edgecolors='black'))
+    # Plot climbing surface, supports and base as one collection so the
+    # 3D projection runs once for all faces
+    ax.add_collection3d(Poly3DCollection(
+        [panel, left_support, right_support, base],
+        facecolors=['lightgray', 'green', 'green', 'brown'],
+        edgecolors=['black', 'green', 'green', 'brown'],
+        alpha=0.3,
+        zsort='min'
+    ))
+
+    # Set axis proportions and labels
+    ax.set_box_aspect([spec.width, spec.height, spec.depth])
+    ax.set_xlabel('Width (m)')
+    ax.set_ylabel('Depth (m)')
+    ax.set_zlabel('Height (m)')
     
-    # Plot support structures
-    ax1.add_collection3d(Poly3DCollection([left_support], facecolors='green', alpha=0.3))
-    ax1.add_collection3d(Poly3DCollection([right_support], facecolors='green', alpha=0.3))
-    ax1.add_collection3d(Poly3DCollection([base], facecolors='brown', alpha=0.3))
-
-    # Set axis limits and labels
-    max_dim = max(spec.width, spec.height, spec.depth)
-    ax1.set_box_aspect([spec.width, spec.height, spec.depth])
-    ax1.set_xlabel('Width (m)')
-    ax1.set_ylabel('Depth (m)')
-    ax1.set_zlabel('Height (m)')
-    
-    # Add dimensions
-    ax1.text(spec.width/2, -0.2, 0, f'{spec.width:.2f}m', ha='center')
-    ax1.text(-0.2, spec.height/2, 0, f'{spec.height:.2f}m', ha='right')
-    ax1.text(spec.width+0.2, 0, spec.depth/2, f'{spec.depth:.2f}m', ha='left')
-    
-    # Top view (top right)
-    ax2 = fig.add_subplot(222)
-    angle = math.radians(spec.angle_deg)
+    # Add dimensions as one label in axes coordinates, which needs no 3D projection
+    ax.text2D(0.02, 0.02, f'W {spec.width:.2f}m  H {spec.height:.2f}m  D {spec.depth:.2f}m',
+              transform=ax.transAxes)
+
+def draw_top(spec: WallSpec, ax):
+    """Draw the panel outline and T-nut grid seen face-on"""
+    from matplotlib.patches import Rectangle
+
     panel_width = spec.width
-    panel_height = spec.height / math.cos(angle)
+    panel_height = spec.panel_height_m
     
     # Draw panel outline
-    ax2.add_patch(plt.Rectangle((0, 0), panel_width, panel_height, fill=False))
+    ax.add_patch(Rectangle((0, 0), panel_width, panel_height, fill=False))
+
+    # Draw T-nut grid as a single artist rather than one marker per T-nut
+    spacing = spec.tnut_spacing
+    xs = np.arange(spacing, panel_width - spacing/2, spacing)
+    ys = np.arange(spacing, panel_height - spacing/2, spacing)
+    if xs.size * ys.size > TNUT_RASTER_THRESHOLD:
+        # One pixel per T-nut with a blank pixel between neighbours, so large
+        # grids cost a single image blit however many T-nuts there are
+        grid = np.full((2 * ys.size - 1, 2 * xs.size - 1), np.nan)
+        grid[::2, ::2] = 1.0
+        half_pixel = spacing / 4
+        ax.imshow(grid, extent=[xs[0] - half_pixel, xs[-1] + half_pixel,
+                                ys[0] - half_pixel, ys[-1] + half_pixel],
+                  origin='lower', cmap='Reds', vmin=0, vmax=1,
+                  interpolation='nearest')
+        ax.autoscale_view()  # imshow fits the limits to the grid, not the panel outline
+    else:
+        X, Y = np.meshgrid(xs, ys)
+        ax.scatter(X.ravel(), Y.ravel(), c="red", s=4, marker="o")
     
-    ax2.set_title('Panel Layout (Top View)')
-    ax2.set_aspect('equal')
-    ax2.set_xlabel('Width (m)')
-    ax2.set_ylabel('Length (m)')
-    
-    # Side view (bottom right)
-    ax3 = fig.add_subplot(224)
+    ax.set_title('Panel Layout (Top View)')
+    ax.set_aspect('equal')
+    ax.set_xlabel('Width (m)')
+    ax.set_ylabel('Length (m)')
+
+def draw_side(spec: WallSpec, ax):
+    """Draw the side profile of the wall and its support"""
+    from matplotlib.collections import LineCollection
+
     h = spec.height
-    d = h * math.tan(angle)
+    d = h * spec.tan_a
     
-    # Draw side profile
-    ax3.plot([0, d], [0, h], 'k-', linewidth=2)
-    ax3.plot([0, 0], [0, h], 'g--', label='Support')
+    # Draw side profile as one collection. The legend samples the first
+    # segment's style, so the support comes first to match its label.
+    profile = LineCollection(
+        [[(0, 0), (0, h)], [(0, 0), (d, h)]],
+        colors=['g', 'k'], linestyles=['--', '-'], linewidths=[1.5, 2],
+        label='Support'
+    )
+    ax.add_collection(profile)
+    ax.autoscale_view()
     
     # Add angle label
-    ax3.text(d/2, h/2, f'{spec.angle_deg}°', ha='center', va='bottom')
+    ax.text(d/2, h/2, f'{spec.angle_deg}°', ha='center', va='bottom')
     
-    ax3.set_title('Side Profile')
-    ax3.set_aspect('equal')
-    ax3.set_xlabel('Depth (m)')
-    ax3.set_ylabel('Height (m)')
-    ax3.legend()
-
-    plt.suptitle('DIY Climbing Wall Design', fontsize=16)
-    plt.tight_layout()
+    ax.set_title('Side Profile')
+    ax.set_aspect('equal')
+    ax.set_xlabel('Depth (m)')
+    ax.set_ylabel('Height (m)')
+    ax.legend()
+
+_VIEW_DRAWERS = {'3d': draw_3d, 'top': draw_top, 'side': draw_side}
+
+def _forget_design(save_path: str):
+    """Drop the cache key of the PNG at save_path before it is overwritten
+
+    Without this, a write interrupted halfway would leave the old key next
+    to a PNG of a different design.
+    """
+    try:
+        os.remove(save_path + ".hash")
+    except FileNotFoundError:
+        pass
+
+def _record_design(save_path: str, key: str):
+    """Mark the PNG at save_path as drawn from the spec behind key"""
+    with open(save_path + ".hash", "w") as f:
+        f.write(key)
+
+def _save_design_png(rgba: np.ndarray, save_path: str, key: str) -> str:
+    """Encode rendered pixels to PNG, run on the _PNG_SAVER thread"""
+    from matplotlib.image import imsave
+
+    _forget_design(save_path)
+    imsave(save_path, rgba, dpi=DESIGN_DPI)
+    _record_design(save_path, key)
+    return save_path
+
+def draw_wall(spec: WallSpec, materials: MaterialList, show: bool = False, axes=None,
+              save_path: str = None, views=DESIGN_VIEWS) -> Future | None:
+    """Draw the wall design and save it to designs/wall_design.png
+
+    Rendering is skipped when the PNG at save_path was already drawn from an
+    equal spec and views, unless the plot window is requested. Otherwise
+    the figure is drawn here and PNG encoding continues in the background.
+
+    Args:
+        show: Also open the interactive plot window after saving
+        axes: Optional axes to draw into instead of creating a new figure,
+            one per entry in views (a 3D axes for '3d'). The caller owns
+            that figure, so nothing is saved or shown.
+        save_path: Where to save the PNG, defaults to designs/wall_design.png
+        views: Which of '3d', 'top' and 'side' to draw, in order. Leaving
+            out '3d' skips the slow 3D projection entirely.
+
+    Returns:
+        Future | None: Future resolving to save_path once the PNG is written
+            (an already queued one if the same design is still being saved),
+            or None when nothing is left to write
+    """
+    unknown = [view for view in views if view not in _VIEW_DRAWERS]
+    if unknown or not views:
+        raise ValueError(f"views must be a non-empty selection of {DESIGN_VIEWS}, got {views!r}")
+
+    if axes is None:
+        if save_path is None:
+            save_path = os.path.join(_HERE, "designs", "wall_design.png")
+        key = _design_key(spec, views)
+        hash_path = save_path + ".hash"
+        pending_key, pending = _PENDING_SAVES.get(save_path, (None, None))
+        if pending is not None and not pending.done():
+            # The file is still being rewritten, so only the queued save counts
+            if not show and pending_key == key:
+                print(f"\nWall design already queued for saving: {save_path}")
+                return pending
+        elif not show and os.path.exists(save_path) and os.path.exists(hash_path):
+            with open(hash_path) as f:
+                if f.read() == key:
+                    print(f"\nWall design unchanged: {save_path}")
+                    return None
+
+        fig = _design_figure(show)
+        axes_to_draw = _add_view_axes(fig, views)
+    else:
+        axes_to_draw = axes
+
+    for view, ax in zip(views, axes_to_draw):
+        _VIEW_DRAWERS[view](spec, ax)
+
+    if axes is not None:
+        return
+
+    fig.suptitle('DIY Climbing Wall Design', fontsize=16)
+    fig.tight_layout()
     
     # Create designs directory if it doesn't exist
-    designs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "designs")
-    os.makedirs(designs_dir, exist_ok=True)
-    
-    # Save the figure
-    save_path = os.path.join(designs_dir, "wall_design.png")
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"\nWall design saved to: {save_path}")
+    _ensure_dir(os.path.dirname(save_path) or ".")
     
-    # Uncomment to show interactive plot instead of saving
-    # plt.show()
-
+    if show:
+        import matplotlib.pyplot as plt
+
+        # Let a queued background save to this path land first, so it can't
+        # overwrite this newer design afterwards
+        if pending is not None:
+            wait((pending,))
+
+        # Save the figure, then record which spec it was drawn from
+        _forget_design(save_path)
+        fig.savefig(save_path, dpi=DESIGN_DPI)  # tight_layout above already fits the margins
+        _record_design(save_path, key)
+        print(f"\nWall design saved to: {save_path}")
+        plt.show()
+        plt.close(fig)  # don't let repeated calls pile up figures in pyplot
+        return None
+
+    # Rasterize now and hand the saver a private copy of the pixels, so the
+    # shared figure can be redrawn while the PNG is still being encoded
+    fig.canvas.draw()
+    rgba = np.array(fig.canvas.buffer_rgba())
+    saved = _PNG_SAVER.submit(_save_design_png, rgba, save_path, key)
+    _PENDING_SAVES[save_path] = (key, saved)
+    print(f"\nWall design queued for saving: {save_path}")
+    return saved
+
+@lru_cache(maxsize=64)
 def create_materials_list(spec: WallSpec, materials: MaterialList) -> str:
     """Create a detailed materials list file with dimensions and quantities
+
+    The content is a pure function of its arguments, so it is cached.
     
     Returns:
         str: The formatted materials list content
     """
+    panel_height = materials.panel_height
+    panel_area = materials.panel_area
+    safety_factor = f"{materials.safety_factor:g}"
+    if materials.safety_factor == SAFETY_FACTOR:
+        safety_factor += " (3.0 × 2.5 for dynamic loads)"
     
-    # Calculate additional measurements
-    angle = math.radians(spec.angle_deg)
-    panel_height = spec.height / math.cos(angle)
-    panel_area = spec.width * panel_height
-    
-    content = f"""=== DIY Climbing Wall Materials List ===
+    parts = [f"""=== DIY Climbing Wall Materials List ===
 
 WALL SPECIFICATIONS
 ------------------
@@ -265,16 +667,18 @@ PLYWOOD PANELS
 -------------
 Type: Structural Plywood (minimum 18mm thick)
 Full Sheets Required: {materials.plywood_sheets}
-Sheet Size: 2500mm x 1250mm
+Note: Sheet count assumes edge strips and offcuts are cut to share sheets
+Sheet Size: {materials.sheet_h_mm}mm x {materials.sheet_w_mm}mm
 Coverage Area Required: {panel_area:.2f} m²
 
 TIMBER FRAME
------------"""
+-----------"""]
 
-    for name, length in materials.timber_lengths:
-        content += f"\n{name}: {length:.2f} m"
+    timber = materials.timber_lengths
+    parts.extend(f"\n{name}: {length:.2f} m"
+                 for name, length in zip(timber['name'].tolist(), timber['length'].tolist()))
     
-    content += f"""
+    parts.append(f"""
 
 HARDWARE RECOMMENDATIONS
 ----------------------
@@ -285,18 +689,17 @@ HARDWARE RECOMMENDATIONS
 - Install holds after completing wall construction and sealing
 
 CRITICAL ANGLES
---------------"""
+--------------""")
     
-    for joint, angle in materials.cut_angles.items():
-        content += f"\n{joint}: {angle:.1f}°"
+    parts.extend(f"\n{joint}: {angle:.1f}°" for joint, angle in materials.cut_angles.items())
 
-    content += f"""
+    parts.append(f"""
 
 SAFETY INFORMATION
 -----------------
 ⚠️ CRITICAL SAFETY WARNINGS ⚠️
 1. Maximum Safe Climber Weight: {materials.safe_climber_weight:.1f} kg
-2. Overall Safety Factor: 7.5 (3.0 × 2.5 for dynamic loads)
+2. Overall Safety Factor: {safety_factor}
 3. Minimum Required Materials:
    - 18mm structural grade plywood
    - Grade 8.8 or higher M10 bolts
@@ -337,18 +740,9 @@ INSTALLATION NOTES
 4. Check all angles before final assembly
 5. Ensure proper anchoring to ground/wall
 6. Apply sealant before installing holds
-7. Double-check all bolt tightness before use"""
+7. Double-check all bolt tightness before use""")
 
-    # Create materials list directory if it doesn't exist
-    materials_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "materials_lists")
-    os.makedirs(materials_dir, exist_ok=True)
-    
-    return content
-
-def frange(start, stop, step):
-    while start < stop:
-        yield round(start,2)
-        start += step
+    return ''.join(parts)
 
 if __name__ == "__main__":
     wall = WallSpec(height=HEIGHT, width=WIDTH, depth=DEPTH)  # depth adjusted to accommodate calculated angle
@@ -362,10 +756,11 @@ if __name__ == "__main__":
     print(f"Wall angle: {wall.angle_deg}°")
 
     print("\nMATERIALS REQUIRED:")
-    print(f"Plywood sheets needed (2500x1250mm): {materials.plywood_sheets}")
+    print(f"Plywood sheets needed ({materials.sheet_h_mm}x{materials.sheet_w_mm}mm): {materials.plywood_sheets}")
     
     print("\nTIMBER CUT LIST (meters):")
-    for name, length in materials.timber_lengths:
+    timber = materials.timber_lengths
+    for name, length in zip(timber['name'].tolist(), timber['length'].tolist()):
         print(f"  {name}: {length:.2f} m")
     
     print("\nCUT ANGLES (degrees):")
@@ -376,16 +771,19 @@ if __name__ == "__main__":
     print(f"Safe maximum climber weight: {materials.safe_climber_weight:.1f} kg")
     print("Remember to test thoroughly before full-weight climbing")
 
-    # Generate the design and materials list
-    draw_wall(wall, materials)
+    # Generate the design and materials list; the PNG is written meanwhile
+    design_saved = draw_wall(wall, materials)
     content = create_materials_list(wall, materials)
     
     # Create materials list directory if it doesn't exist
-    materials_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "materials_lists")
-    os.makedirs(materials_dir, exist_ok=True)
+    materials_dir = os.path.join(_HERE, "materials_lists")
+    _ensure_dir(materials_dir)
     
     # Save the materials list
     materials_path = os.path.join(materials_dir, "materials_list.txt")
     with open(materials_path, 'w') as f:
         f.write(content)
     print(f"\nDetailed materials list saved to: {materials_path}")
+
+    if design_saved is not None:
+        print(f"\nWall design saved to: {design_saved.result()}")